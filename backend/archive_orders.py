@@ -0,0 +1,110 @@
+import argparse
+import gzip
+import os
+import re
+from datetime import datetime
+
+from main import app, db, month_start, partition_name, order_partitions, now_vn
+
+ARCHIVE_FOLDER = app.config['ORDER_ARCHIVE_FOLDER']
+
+# order_items is detached first on archive and attached last on restore,
+# its partitions reference the orders partition of the same month
+ARCHIVE_ORDER = ('order_items', 'orders')
+RESTORE_ORDER = ('orders', 'order_items')
+
+
+def parse_month(value):
+    return datetime.strptime(value, '%Y-%m')
+
+
+def archive_path(table, month):
+    return os.path.join(ARCHIVE_FOLDER, partition_name(table, month) + '.csv.gz')
+
+
+def partition_months(table):
+    months = []
+    for row in order_partitions(table):
+        match = re.fullmatch(rf'{table}_y(\d{{4}})m(\d{{2}})', row.name)
+        if match:
+            months.append(datetime(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def list_partitions():
+    for table in reversed(ARCHIVE_ORDER):
+        print(table)
+        for row in order_partitions(table):
+            count = db.session.execute(db.text(f"SELECT count(*) FROM {row.name}")).scalar()
+            print(f"    {row.name:<28} {count:>10} rows  {row.bound}")
+    files = sorted(os.listdir(ARCHIVE_FOLDER)) if os.path.isdir(ARCHIVE_FOLDER) else []
+    print('archived')
+    for name in files:
+        size = os.path.getsize(os.path.join(ARCHIVE_FOLDER, name))
+        print(f"    {name:<36} {size:>10} bytes")
+
+
+def archive(before):
+    if before > month_start(now_vn()):
+        print("❌ Refusing to archive the current or a future month")
+        return
+    os.makedirs(ARCHIVE_FOLDER, exist_ok=True)
+    for month in [m for m in partition_months('orders') if m < before]:
+        try:
+            cursor = db.session.connection().connection.cursor()
+            for table in ARCHIVE_ORDER:
+                name = partition_name(table, month)
+                path = archive_path(table, month)
+                db.session.execute(db.text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                with gzip.open(path, 'wt', encoding='utf-8', newline='') as f:
+                    cursor.copy_expert(f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)", f)
+                db.session.execute(db.text(f"DROP TABLE {name}"))
+                print(f"✅ {name} -> {path}")
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Archiving {month:%Y-%m} failed:", e)
+            return
+
+
+def restore(month):
+    try:
+        cursor = db.session.connection().connection.cursor()
+        for table in RESTORE_ORDER:
+            name = partition_name(table, month)
+            path = archive_path(table, month)
+            db.session.execute(db.text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+            with gzip.open(path, 'rt', encoding='utf-8', newline='') as f:
+                cursor.copy_expert(f"COPY {name} FROM STDIN WITH (FORMAT csv, HEADER)", f)
+            db.session.execute(db.text(
+                f"ALTER TABLE {table} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{month_start(month, 1):%Y-%m-%d}')"
+            ))
+            print(f"✅ {path} -> {name}")
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Restoring {month:%Y-%m} failed:", e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Archive and restore monthly order partitions')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list')
+    archive_parser = sub.add_parser('archive')
+    archive_parser.add_argument('--before', type=parse_month, required=True, help='YYYY-MM, months before it are archived')
+    restore_parser = sub.add_parser('restore')
+    restore_parser.add_argument('--month', type=parse_month, required=True, help='YYYY-MM')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.command == 'list':
+            list_partitions()
+        elif args.command == 'archive':
+            archive(args.before)
+        else:
+            restore(args.month)
+
+
+if __name__ == '__main__':
+    main()
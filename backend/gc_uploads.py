@@ -0,0 +1,134 @@
+import argparse
+import os
+import shutil
+import time
+from datetime import datetime
+
+from main import app, db, media_path
+
+UPLOAD_FOLDER = app.config['UPLOAD_FOLDER']
+UPLOAD_TMP_FOLDER = app.config['UPLOAD_TMP_FOLDER']
+QUARANTINE_FOLDER = os.path.join(os.path.dirname(UPLOAD_FOLDER), 'uploads_quarantine')
+BATCH = 5000
+
+REFERENCED_SQL = """
+SELECT path FROM product_images
+UNION ALL
+SELECT primary_image FROM products WHERE primary_image IS NOT NULL
+UNION ALL
+SELECT avatar FROM sellers WHERE avatar IS NOT NULL
+"""
+
+LEGACY_IMAGE_URL_SQL = """
+SELECT btrim(unnest(string_to_array(image_url, ','))) FROM products WHERE image_url IS NOT NULL
+"""
+
+
+def upload_relpath(value):
+    path = media_path(value)
+    if path.startswith('/uploads/'):
+        return path[len('/uploads/'):]
+    if path and '/' not in path:
+        return path
+    return None
+
+
+def referenced_files():
+    statements = [REFERENCED_SQL]
+    has_legacy = db.session.execute(db.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'products' AND column_name = 'image_url'
+    """)).first()
+    if has_legacy:
+        statements.append(LEGACY_IMAGE_URL_SQL)
+
+    # Server-side cursor, only the set of relative paths is kept in memory
+    referenced = set()
+    with db.engine.connect() as conn:
+        for sql in statements:
+            result = conn.execution_options(stream_results=True, max_row_buffer=BATCH).execute(db.text(sql))
+            for rows in result.partitions(BATCH):
+                for (value,) in rows:
+                    relpath = upload_relpath(value)
+                    if relpath:
+                        referenced.add(relpath)
+    return referenced
+
+
+def walk(folder):
+    stack = [folder]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def old_files(folder, cutoff):
+    if not os.path.isdir(folder):
+        return []
+    return [
+        (os.path.relpath(entry.path, folder), entry.stat().st_size)
+        for entry in walk(folder)
+        if entry.stat().st_mtime < cutoff
+    ]
+
+
+def remove(folder, relpath, mode, quarantine):
+    source = os.path.join(folder, relpath)
+    if mode == 'delete':
+        os.remove(source)
+    elif mode == 'quarantine':
+        target = os.path.join(quarantine, relpath)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(source, target)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remove upload files no longer referenced by the database')
+    parser.add_argument('--mode', choices=['dry-run', 'quarantine', 'delete'], default='dry-run')
+    parser.add_argument('--grace-hours', type=float, default=24,
+                        help='files modified more recently are kept, they may belong to a product being saved')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    now = time.time()
+    cutoff = now - args.grace_hours * 3600
+    quarantine = os.path.join(QUARANTINE_FOLDER, datetime.now().strftime('%Y%m%dT%H%M%S'))
+
+    with app.app_context():
+        try:
+            db.session.execute(db.text("SELECT 1"))
+            print("✅ Database connected successfully")
+
+            # List files before reading references, so a file attached while the scan runs
+            # is either too new to be a candidate or already visible in the references
+            candidates = old_files(UPLOAD_FOLDER, cutoff)
+            referenced = referenced_files()
+            print(f"✅ {len(referenced)} referenced paths, {len(candidates)} files older than {args.grace_hours:g}h")
+
+            orphans = [(relpath, size) for relpath, size in candidates if relpath not in referenced]
+            for relpath, size in orphans:
+                if args.verbose or args.mode == 'dry-run':
+                    print(f"    {relpath}  {size} bytes")
+                remove(UPLOAD_FOLDER, relpath, args.mode, quarantine)
+
+            # Abandoned .part files and expired resumable sessions
+            stale = old_files(UPLOAD_TMP_FOLDER, min(cutoff, now - app.config['UPLOAD_SESSION_TTL']))
+            for relpath, size in stale:
+                if args.verbose or args.mode == 'dry-run':
+                    print(f"    tmp/{relpath}  {size} bytes")
+                if args.mode != 'dry-run':
+                    os.remove(os.path.join(UPLOAD_TMP_FOLDER, relpath))
+
+            verb = {'dry-run': 'Would remove', 'quarantine': f'Quarantined into {quarantine}', 'delete': 'Deleted'}[args.mode]
+            print(f"✅ {verb}: {len(orphans)} orphaned uploads ({sum(s for _, s in orphans)} bytes), "
+                  f"{len(stale)} stale temp files ({sum(s for _, s in stale)} bytes)")
+        except Exception as e:
+            print("❌ Upload GC failed:", e)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+
+# Each open /events/orders stream is a greenlet waiting on its queue, not an OS thread
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 2000))
+timeout = 60
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension, without this a query blocks every greenlet in the worker
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
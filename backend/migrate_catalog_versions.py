@@ -0,0 +1,43 @@
+from main import app, db, CatalogVersion
+
+TRIGGERS = [
+    ('products_bump_catalog_version', 'products', 'DELETE OR TRUNCATE', 'products'),
+    ('categories_bump_catalog_version', 'categories', 'INSERT OR UPDATE OR DELETE OR TRUNCATE', 'categories'),
+]
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        CatalogVersion.__table__.create(db.engine, checkfirst=True)
+        db.session.execute(db.text("""
+            INSERT INTO catalog_versions (name, version, changed_at)
+            VALUES ('products', 0, now()), ('categories', 0, now())
+            ON CONFLICT (name) DO NOTHING
+        """))
+
+        # Statement level, so a bulk delete bumps once; these changes are rare enough
+        # that the row lock on catalog_versions never contends with checkout
+        db.session.execute(db.text("""
+            CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+            BEGIN
+                UPDATE catalog_versions SET version = version + 1, changed_at = now()
+                WHERE name = TG_ARGV[0];
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """))
+        for trigger, table, events, name in TRIGGERS:
+            db.session.execute(db.text(f"DROP TRIGGER IF EXISTS {trigger} ON {table}"))
+            db.session.execute(db.text(
+                f"CREATE TRIGGER {trigger} AFTER {events} ON {table} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version('{name}')"
+            ))
+            print(f"✅ {trigger}")
+
+        db.session.commit()
+        print("✅ catalog_versions ready, run migrate_indexes.py for the new timestamp indexes")
+    except Exception as e:
+        db.session.rollback()
+        print("❌ Migration failed:", e)
@@ -0,0 +1,13 @@
+from main import app, db
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+                print(f"✅ {index.name}")
+    except Exception as e:
+        print("❌ Creating indexes failed:", e)
@@ -0,0 +1,11 @@
+from main import app, db, Job
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        Job.__table__.create(db.engine, checkfirst=True)
+        print("✅ jobs table ready")
+    except Exception as e:
+        print("❌ Migration failed:", e)
@@ -0,0 +1,116 @@
+import sys
+
+from main import (
+    app, db, Order, OrderItem, PARTITIONED_ORDER_TABLES,
+    month_start, create_order_partition, ensure_order_partitions, now_vn
+)
+
+KEEP_LEGACY = '--keep-legacy' in sys.argv
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        partitioned = db.session.execute(db.text(
+            "SELECT relkind = 'p' FROM pg_class WHERE relname = 'orders'"
+        )).scalar()
+
+        if partitioned:
+            created = ensure_order_partitions()
+            db.session.commit()
+            print(f"✅ orders already partitioned, created {len(created)} new partitions")
+            sys.exit(0)
+
+        db.session.execute(db.text(
+            "ALTER TABLE order_items ADD COLUMN IF NOT EXISTS order_created_at TIMESTAMP"
+        ))
+        db.session.execute(db.text(
+            "UPDATE orders SET created_at = now() WHERE created_at IS NULL"
+        ))
+        db.session.execute(db.text("""
+            UPDATE order_items oi SET order_created_at = o.created_at
+            FROM orders o
+            WHERE o.id = oi.order_id AND oi.order_created_at IS DISTINCT FROM o.created_at
+        """))
+
+        # Keep the old tables aside under new names, the pkey index names would clash otherwise
+        db.session.execute(db.text("ALTER TABLE order_items RENAME TO order_items_legacy"))
+        db.session.execute(db.text("ALTER TABLE orders RENAME TO orders_legacy"))
+        db.session.execute(db.text("ALTER TABLE order_items_legacy RENAME CONSTRAINT order_items_pkey TO order_items_legacy_pkey"))
+        db.session.execute(db.text("ALTER TABLE orders_legacy RENAME CONSTRAINT orders_pkey TO orders_legacy_pkey"))
+        for table in (Order.__table__, OrderItem.__table__):
+            for index in table.indexes:
+                db.session.execute(db.text(f"DROP INDEX IF EXISTS {index.name}"))
+
+        # The partition key has to be part of every unique constraint, so the primary keys
+        # become (id, created_at) and order_items references orders on both columns
+        db.session.execute(db.text("""
+            CREATE TABLE orders (
+                id INTEGER NOT NULL DEFAULT nextval('orders_id_seq'),
+                buyer_id INTEGER NOT NULL REFERENCES buyers (id),
+                shopping_address VARCHAR(255) NOT NULL,
+                total_amount NUMERIC(10, 2) NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (id, created_at)
+            ) PARTITION BY RANGE (created_at)
+        """))
+        db.session.execute(db.text("""
+            CREATE TABLE order_items (
+                id INTEGER NOT NULL DEFAULT nextval('order_items_id_seq'),
+                order_id INTEGER NOT NULL,
+                order_created_at TIMESTAMP NOT NULL,
+                product_id INTEGER NOT NULL REFERENCES products (id),
+                quantity INTEGER NOT NULL,
+                seller_id INTEGER NOT NULL REFERENCES sellers (id),
+                unit_price NUMERIC(10, 2) NOT NULL,
+                subtotal NUMERIC(10, 2) NOT NULL,
+                status order_item_status NOT NULL,
+                PRIMARY KEY (id, order_created_at),
+                FOREIGN KEY (order_id, order_created_at) REFERENCES orders (id, created_at)
+            ) PARTITION BY RANGE (order_created_at)
+        """))
+        db.session.execute(db.text("ALTER SEQUENCE orders_id_seq OWNED BY orders.id"))
+        db.session.execute(db.text("ALTER SEQUENCE order_items_id_seq OWNED BY order_items.id"))
+
+        first = db.session.execute(db.text("SELECT min(created_at) FROM orders_legacy")).scalar()
+        month = month_start(first or now_vn())
+        last = month_start(now_vn(), app.config['ORDER_PARTITION_MONTHS_AHEAD'])
+        count = 0
+        while month <= last:
+            for table in PARTITIONED_ORDER_TABLES:
+                create_order_partition(table, month)
+            count += 1
+            month = month_start(month, 1)
+        for table in PARTITIONED_ORDER_TABLES:
+            db.session.execute(db.text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"))
+        print(f"✅ Created {count} monthly partitions per table")
+
+        orders = db.session.execute(db.text("""
+            INSERT INTO orders (id, buyer_id, shopping_address, total_amount, created_at)
+            SELECT id, buyer_id, shopping_address, total_amount, created_at FROM orders_legacy
+        """)).rowcount
+        items = db.session.execute(db.text("""
+            INSERT INTO order_items (id, order_id, order_created_at, product_id, quantity,
+                                     seller_id, unit_price, subtotal, status)
+            SELECT id, order_id, order_created_at, product_id, quantity,
+                   seller_id, unit_price, subtotal, status
+            FROM order_items_legacy
+        """)).rowcount
+        print(f"✅ Copied {orders} orders and {items} order items")
+
+        connection = db.session.connection()
+        for table in (Order.__table__, OrderItem.__table__):
+            for index in table.indexes:
+                index.create(connection)
+                print(f"✅ {index.name}")
+
+        if not KEEP_LEGACY:
+            db.session.execute(db.text("DROP TABLE order_items_legacy"))
+            db.session.execute(db.text("DROP TABLE orders_legacy"))
+            print("✅ Dropped legacy tables")
+
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print("❌ Migration failed:", e)
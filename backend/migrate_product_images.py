@@ -0,0 +1,56 @@
+import re
+import sys
+
+from main import app, db, ProductImage
+
+DROP_LEGACY = '--drop-legacy' in sys.argv
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        ProductImage.__table__.create(db.engine, checkfirst=True)
+        db.session.execute(db.text(
+            "ALTER TABLE products ADD COLUMN IF NOT EXISTS primary_image VARCHAR(300)"
+        ))
+
+        has_legacy = db.session.execute(db.text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'products' AND column_name = 'image_url'
+        """)).first()
+
+        if has_legacy:
+            # Split the comma-joined list once, keeping order, stripping any stored media base
+            # and dropping empty entries
+            inserted = db.session.execute(db.text("""
+                INSERT INTO product_images (product_id, position, path)
+                SELECT product_id, (row_number() OVER (PARTITION BY product_id ORDER BY ord)) - 1, path
+                FROM (
+                    SELECT p.id AS product_id, t.ord,
+                           regexp_replace(btrim(t.path), :base_pattern, '') AS path
+                    FROM products p
+                    CROSS JOIN LATERAL unnest(string_to_array(p.image_url, ',')) WITH ORDINALITY AS t(path, ord)
+                    WHERE NOT EXISTS (SELECT 1 FROM product_images pi WHERE pi.product_id = p.id)
+                ) s
+                WHERE path <> ''
+            """), {'base_pattern': '^(' + re.escape(app.config['MEDIA_BASE_URL']) + ')+'}).rowcount
+            print(f"✅ Copied {inserted} images into product_images")
+
+        updated = db.session.execute(db.text("""
+            UPDATE products p
+            SET primary_image = pi.path
+            FROM product_images pi
+            WHERE pi.product_id = p.id AND pi.position = 0
+              AND p.primary_image IS DISTINCT FROM pi.path
+        """)).rowcount
+        print(f"✅ Set primary_image on {updated} products")
+
+        if has_legacy and DROP_LEGACY:
+            db.session.execute(db.text("ALTER TABLE products DROP COLUMN image_url"))
+            print("✅ Dropped products.image_url")
+
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print("❌ Migration failed:", e)
@@ -0,0 +1,28 @@
+from main import app, db, StockReservation
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        db.session.execute(db.text(
+            "ALTER TABLE products ADD COLUMN IF NOT EXISTS reserved_quantity INTEGER NOT NULL DEFAULT 0"
+        ))
+        db.session.commit()
+
+        StockReservation.__table__.create(db.engine, checkfirst=True)
+        print("✅ stock_reservations table ready")
+
+        # Existing cart lines hold nothing until the buyer touches them again,
+        # checkout still checks them against unreserved stock
+        db.session.execute(db.text("""
+            UPDATE products p
+            SET reserved_quantity = COALESCE((
+                SELECT SUM(quantity) FROM stock_reservations sr WHERE sr.product_id = p.id
+            ), 0)
+        """))
+        db.session.commit()
+        print("✅ products.reserved_quantity recomputed")
+    except Exception as e:
+        db.session.rollback()
+        print("❌ Migration failed:", e)
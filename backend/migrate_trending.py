@@ -0,0 +1,12 @@
+from main import app, db, ProductViewDaily, ProductRanking
+
+with app.app_context():
+    try:
+        db.session.execute(db.text("SELECT 1"))
+        print("✅ Database connected successfully")
+
+        ProductViewDaily.__table__.create(db.engine, checkfirst=True)
+        ProductRanking.__table__.create(db.engine, checkfirst=True)
+        print("✅ product_view_daily and product_rankings tables ready")
+    except Exception as e:
+        print("❌ Migration failed:", e)
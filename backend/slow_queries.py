@@ -0,0 +1,118 @@
+import argparse
+import glob
+import json
+import os
+import re
+from collections import defaultdict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LOG = os.path.join(os.environ.get('LOG_FOLDER', os.path.join(BASE_DIR, 'logs')), 'slow_queries.log')
+
+
+def fingerprint(statement):
+    sql = re.sub(r'%\(\w+\)s|%s', '?', statement)
+    sql = re.sub(r"'[^']*'", '?', sql)
+    sql = re.sub(r'\b\d+\b', '?', sql)
+    return re.sub(r'\s+', ' ', sql).strip()
+
+
+def read_records(log_path):
+    paths = sorted(glob.glob(log_path + '.*'), reverse=True) + [log_path]
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def summarize(log_path):
+    groups = {}
+    plans = {}
+    query_group = {}
+
+    for rec in read_records(log_path):
+        if rec.get('type') == 'query':
+            key = fingerprint(rec['statement'])
+            g = groups.setdefault(key, {
+                'statement': key,
+                'count': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'routes': defaultdict(int),
+                'worst': None,
+                'plan': None,
+            })
+            g['count'] += 1
+            g['total_ms'] += rec['duration_ms']
+            g['routes'][rec.get('route') or '-'] += 1
+            if rec['duration_ms'] >= g['max_ms']:
+                g['max_ms'] = rec['duration_ms']
+                g['worst'] = rec
+            query_group[rec['id']] = key
+        elif rec.get('type') == 'explain':
+            plans[rec['id']] = rec['plan']
+
+    for query_id, plan in plans.items():
+        key = query_group.get(query_id)
+        if key:
+            groups[key]['plan'] = plan
+
+    for g in groups.values():
+        g['avg_ms'] = g['total_ms'] / g['count']
+    return list(groups.values())
+
+
+def plan_summary(plan):
+    if not plan:
+        return None
+    root = plan[0] if isinstance(plan, list) else plan
+    node = root.get('Plan', {})
+    return {
+        'node': node.get('Node Type'),
+        # Writes are only planned without ANALYZE, fall back to the estimates
+        'rows': node.get('Actual Rows', node.get('Plan Rows')),
+        'cost': node.get('Total Cost'),
+        'shared_hit': node.get('Shared Hit Blocks'),
+        'shared_read': node.get('Shared Read Blocks'),
+        'execution_ms': root.get('Execution Time'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize the slow query log')
+    parser.add_argument('--log', default=DEFAULT_LOG)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--sort', choices=['total', 'max', 'avg', 'count'], default='total')
+    parser.add_argument('--show-plan', action='store_true')
+    args = parser.parse_args()
+
+    sort_key = {'total': 'total_ms', 'max': 'max_ms', 'avg': 'avg_ms', 'count': 'count'}[args.sort]
+    groups = sorted(summarize(args.log), key=lambda g: g[sort_key], reverse=True)[:args.top]
+
+    if not groups:
+        print('No slow queries recorded')
+        return
+
+    for i, g in enumerate(groups, 1):
+        routes = ', '.join(f'{r} ({n})' for r, n in sorted(g['routes'].items(), key=lambda x: -x[1]))
+        print(f"#{i}  count={g['count']}  total={g['total_ms']:.1f}ms  avg={g['avg_ms']:.1f}ms  max={g['max_ms']:.1f}ms")
+        print(f"    routes: {routes}")
+        print(f"    sql: {g['statement'][:300]}")
+        print(f"    worst params: {json.dumps(g['worst']['parameters'], ensure_ascii=False, default=str)[:300]}")
+        summary = plan_summary(g['plan'])
+        if summary:
+            print(f"    plan: {summary}")
+            if args.show_plan:
+                print(json.dumps(g['plan'], indent=2, ensure_ascii=False))
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+
+from main import (
+    app, db, JOB_HANDLERS, claim_job, finish_job, fail_job,
+    requeue_stalled_jobs, schedule_periodic_jobs, job_queue_stats
+)
+
+
+def work(queues, poll_interval, stop, worker_id, forked=False):
+    with app.app_context():
+        if forked:
+            # A forked process must not reuse the parent's pooled connections
+            db.engine.dispose(close=False)
+
+        while not stop.is_set():
+            try:
+                job = claim_job(queues, worker_id)
+            except Exception as e:
+                db.session.rollback()
+                app.logger.warning('[%s] claim failed: %s', worker_id, e)
+                stop.wait(poll_interval)
+                continue
+
+            if job is None:
+                stop.wait(poll_interval)
+                continue
+
+            handler = JOB_HANDLERS.get(job.name)
+            try:
+                if handler is None:
+                    raise LookupError(f'No handler registered for job "{job.name}"')
+                handler(job.payload)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                fail_job(job.id, job.attempts, job.max_attempts, traceback.format_exc(limit=5))
+                continue
+
+            finish_job(job.id)
+
+
+def supervise(stop, interval):
+    with app.app_context():
+        while True:
+            try:
+                schedule_periodic_jobs()
+                stalled = requeue_stalled_jobs()
+                if stalled:
+                    print(f'Requeued {stalled} stalled jobs')
+            except Exception as e:
+                db.session.rollback()
+                app.logger.warning('supervisor check failed: %s', e)
+            if stop.wait(interval):
+                break
+
+
+def run(args):
+    queues = args.queues.split(',')
+    host = f'{socket.gethostname()}:{os.getpid()}'
+
+    if args.mode == 'process':
+        ctx = multiprocessing.get_context('fork')
+        stop = ctx.Event()
+        workers = [
+            ctx.Process(target=work, args=(queues, args.poll_interval, stop, f'{host}/p{i}', True), daemon=True)
+            for i in range(args.concurrency)
+        ]
+    else:
+        stop = threading.Event()
+        workers = [
+            threading.Thread(target=work, args=(queues, args.poll_interval, stop, f'{host}/t{i}'), daemon=True)
+            for i in range(args.concurrency)
+        ]
+
+    def shutdown(signum, frame):
+        print('Stopping workers, waiting for running jobs to finish...')
+        stop.set()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    for w in workers:
+        w.start()
+    print(f'✅ {args.concurrency} {args.mode} workers on queues {queues}')
+
+    supervisor_stop = threading.Event()
+    threading.Thread(target=supervise, args=(supervisor_stop, args.supervise_interval), daemon=True).start()
+
+    while not stop.is_set():
+        time.sleep(0.5)
+    for w in workers:
+        w.join()
+    supervisor_stop.set()
+
+
+def stats(args):
+    with app.app_context():
+        rows = job_queue_stats()
+    if not rows:
+        print('No jobs')
+        return
+    print(f"{'queue':<15}{'ready':>8}{'sched':>8}{'running':>9}{'failed':>8}{'oldest(s)':>11}{'wait(s)':>9}{'run(s)':>8}")
+    for r in rows:
+        print(
+            f"{r['queue']:<15}{r['ready']:>8}{r['scheduled']:>8}{r['running']:>9}{r['failed']:>8}"
+            f"{r['oldest_ready_seconds']:>11.1f}{r['avg_wait_seconds']:>9.2f}{r['avg_run_seconds']:>8.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Background job worker')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help='Process jobs')
+    run_parser.add_argument('--queues', default='default', help='Comma-separated queue names')
+    run_parser.add_argument('--concurrency', type=int, default=4)
+    run_parser.add_argument('--mode', choices=['thread', 'process'], default='thread')
+    run_parser.add_argument('--poll-interval', type=float, default=1.0)
+    run_parser.add_argument('--supervise-interval', type=float, default=60.0)
+    run_parser.set_defaults(func=run)
+
+    stats_parser = sub.add_parser('stats', help='Show queue depth and latency')
+    stats_parser.set_defaults(func=stats)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -58,7 +58,7 @@ export default function HomeScreen() {
       if (!res.ok) throw new Error();
       const data = await res.json();
 
-      const mapped = data.map((p: any) => {
+      const mapped = data.products.map((p: any) => {
         let imageUrl = p.image_url ? p.image_url.split(',')[0].trim() : '';
         if (imageUrl.includes('http://10.0.2.2:5000http://10.0.2.2:5000')) {
           imageUrl = imageUrl.replace('http://10.0.2.2:5000http://10.0.2.2:5000', 'http://10.0.2.2:5000');
@@ -56,16 +56,29 @@ export default function OrdersScreen() {
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
   const [selectedTab, setSelectedTab] = useState<'all' | 'pending' | 'confirmed' | 'shipping' | 'completed'>('all');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  const loadOrders = async () => {
+  const loadOrders = async (cursor: string | null = null) => {
     try {
       const storedUser = await AsyncStorage.getItem('user');
       if (!storedUser) return;
 
       const user = JSON.parse(storedUser);
-      const res = await axios.get(`${API_BASE}/orders?buyer_id=${user.id}`);
+      const res = await axios.get(`${API_BASE}/orders`, {
+        params: { buyer_id: user.id, cursor: cursor || undefined },
+      });
 
-      setOrders(res.data);
+      const items: OrderItem[] = res.data.orders.flatMap((order: any) =>
+        order.items.map((item: any) => ({
+          ...item,
+          id: String(item.order_item_id),
+          orderDate: order.orderDate,
+        }))
+      );
+
+      setOrders(prev => (cursor ? [...prev, ...items] : items));
+      setNextCursor(res.data.next_cursor);
     } catch (e) {
       console.log('Load orders error:', e);
     } finally {
@@ -73,6 +86,12 @@ export default function OrdersScreen() {
     }
   };
 
+  const loadMore = () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    loadOrders(nextCursor).finally(() => setLoadingMore(false));
+  };
+
   useEffect(() => {
     loadOrders();
   }, []);
@@ -162,8 +181,11 @@ export default function OrdersScreen() {
 
       <FlatList
         data={filteredOrders}
-        keyExtractor={(_, index) => index.toString()}
+        keyExtractor={(item) => item.id}
         renderItem={renderItem}
+        onEndReached={loadMore}
+        onEndReachedThreshold={0.5}
+        ListFooterComponent={loadingMore ? <ActivityIndicator color="#e11d48" style={{ marginVertical: 16 }} /> : null}
         refreshControl={
           <RefreshControl refreshing={refreshing} onRefresh={onRefresh} colors={['#e11d48']} />
         }
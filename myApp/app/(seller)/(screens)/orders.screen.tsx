@@ -75,8 +75,9 @@ const parseVnDate = (str: string | null | undefined): Date => {
 };
 
 export default function OrdersScreen() {
-  const [rawOrders, setRawOrders] = useState<any[]>([]);
   const [orders, setOrders] = useState<OrderDetail[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [statusCounts, setStatusCounts] = useState<Record<string, number>>({});
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
   const [searchQuery, setSearchQuery] = useState('');
@@ -103,50 +104,38 @@ export default function OrdersScreen() {
     loadSellerId();
   }, []);
 
-  const fetchOrders = useCallback(async () => {
+  const fetchOrders = useCallback(async (cursor: string | null = null) => {
     if (!sellerId) return;
-    setLoading(true);
+    if (!cursor) setLoading(true);
     try {
       const from = format(fromDate, 'yyyy-MM-dd');
       const to = format(toDate, 'yyyy-MM-dd');
-      const url = `${API_BASE}/seller/${sellerId}/orders?from_date=${from}&to_date=${to}`;
+      let url = `${API_BASE}/seller/${sellerId}/orders?from_date=${from}&to_date=${to}&limit=50`;
+      if (cursor) url += `&cursor=${encodeURIComponent(cursor)}`;
       const response = await fetch(url);
       if (!response.ok) throw new Error();
       const data = await response.json();
-      setRawOrders(data);
-
-      const grouped: { [key: string]: OrderDetail & { total_amount: number } } = {};
-
-      data.forEach((item: any) => {
-        const orderId = item.order_id.toString();
-        if (!grouped[orderId]) {
-          grouped[orderId] = {
-            id: orderId,
-            order_code: item.order_code,
-            customer_name: item.buyer?.full_name || 'Khách hàng',
-            customer_phone: item.buyer?.phone || '---',
-            total_amount: 0, 
-            created_at: parseVnDate(item.created_at),
-            items: [],
-          };
-        }
-        grouped[orderId].items.push({
+
+      const pageOrders: OrderDetail[] = data.orders.map((order: any) => ({
+        id: order.order_id.toString(),
+        order_code: order.order_code,
+        customer_name: order.buyer?.full_name || 'Khách hàng',
+        customer_phone: order.buyer?.phone || '---',
+        total_amount: `₫${Number(order.seller_total).toLocaleString('vi-VN')}`,
+        created_at: parseVnDate(order.created_at),
+        items: order.items.map((item: any) => ({
           order_item_id: item.order_item_id,
           product_name: item.product.name,
           quantity: item.product.quantity,
           unit_price: item.product.price,
           subtotal: item.seller_subtotal,
           status: item.status,
-        });
-        grouped[orderId].total_amount += Number(item.seller_subtotal);
-      });
-
-      const finalOrders = Object.values(grouped).map(o => ({
-        ...o,
-        total_amount: `₫${o.total_amount.toLocaleString('vi-VN')}`,
+        })),
       }));
 
-      setOrders(finalOrders);
+      setOrders(prev => (cursor ? [...prev, ...pageOrders] : pageOrders));
+      setNextCursor(data.next_cursor);
+      setStatusCounts(data.status_counts || {});
     } catch {
       Alert.alert('Lỗi', 'Không thể tải danh sách đơn hàng');
     } finally {
@@ -155,6 +144,13 @@ export default function OrdersScreen() {
     }
   }, [sellerId, fromDate, toDate]);
 
+  const goToNextPage = async () => {
+    if (currentPage === totalPages && nextCursor) {
+      await fetchOrders(nextCursor);
+    }
+    setCurrentPage(p => p + 1);
+  };
+
   useEffect(() => {
     if (sellerId) fetchOrders();
   }, [fetchOrders, sellerId]);
@@ -295,11 +291,11 @@ export default function OrdersScreen() {
             dropdownIconColor="#3b82f6"
           >
             <Picker.Item label="Tất cả trạng thái" value="all" />
-            <Picker.Item label="Chờ xác nhận" value="pending" />
-            <Picker.Item label="Đã xác nhận" value="confirmed" />
-            <Picker.Item label="Đang giao" value="shipping" />
-            <Picker.Item label="Hoàn thành" value="completed" />
-            <Picker.Item label="Đã hủy" value="cancelled" />
+            <Picker.Item label={`Chờ xác nhận (${statusCounts.pending || 0})`} value="pending" />
+            <Picker.Item label={`Đã xác nhận (${statusCounts.confirmed || 0})`} value="confirmed" />
+            <Picker.Item label={`Đang giao (${statusCounts.shipping || 0})`} value="shipping" />
+            <Picker.Item label={`Hoàn thành (${statusCounts.completed || 0})`} value="completed" />
+            <Picker.Item label={`Đã hủy (${statusCounts.cancelled || 0})`} value="cancelled" />
           </Picker>
         </View>
 
@@ -450,7 +446,7 @@ export default function OrdersScreen() {
       </Modal>
 
       {/* PAGINATION */}
-      {totalPages > 1 && (
+      {(totalPages > 1 || !!nextCursor) && (
         <View style={styles.paginationContainer}>
           <TouchableOpacity
             style={[styles.pageButton, currentPage === 1 && styles.pageDisabled]}
@@ -459,13 +455,13 @@ export default function OrdersScreen() {
           >
             <Ionicons name="chevron-back" size={22} color={currentPage === 1 ? '#d1d5db' : '#4b5563'} />
           </TouchableOpacity>
-          <Text style={styles.pageInfo}>{currentPage} / {totalPages}</Text>
+          <Text style={styles.pageInfo}>{currentPage} / {totalPages}{nextCursor ? '+' : ''}</Text>
           <TouchableOpacity
-            style={[styles.pageButton, currentPage === totalPages && styles.pageDisabled]}
-            disabled={currentPage === totalPages}
-            onPress={() => setCurrentPage(p => Math.min(totalPages, p + 1))}
+            style={[styles.pageButton, currentPage === totalPages && !nextCursor && styles.pageDisabled]}
+            disabled={currentPage === totalPages && !nextCursor}
+            onPress={goToNextPage}
           >
-            <Ionicons name="chevron-forward" size={22} color={currentPage === totalPages ? '#d1d5db' : '#4b5563'} />
+            <Ionicons name="chevron-forward" size={22} color={currentPage === totalPages && !nextCursor ? '#d1d5db' : '#4b5563'} />
           </TouchableOpacity>
         </View>
       )}